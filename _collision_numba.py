@@ -0,0 +1,69 @@
+"""Optional Numba-compiled collision kernels.
+
+Importing this module requires numba; collision.py imports it lazily and
+falls back to the pure-NumPy broad phase when it is unavailable.
+"""
+from numba import njit
+
+
+@njit(cache=True)
+def resolve_horizontal_kernel(l, t, r, b, vx, aabb):
+    """Snap the (l, t, r, b) box out of any overlapping aabb row along x.
+
+    Overlap is tested against the incoming box, matching the NumPy broad
+    phase; returns the resolved left edge and whether a snap occurred.
+    The fallback never zeroes `vx`, so every overlapping row snaps and
+    the last one wins — mirrored here deliberately.
+    """
+    w = r - l
+    l0 = l
+    r0 = r
+    hit = False
+    for i in range(aabb.shape[0]):
+        if (aabb[i, 2] > l0 and aabb[i, 0] < r0
+                and aabb[i, 3] > t and aabb[i, 1] < b):
+            if vx > 0:
+                l = aabb[i, 0] - w
+            elif vx < 0:
+                l = aabb[i, 2]
+            hit = True
+    return l, hit
+
+
+@njit(cache=True)
+def resolve_vertical_kernel(l, t, r, b, vy, aabb):
+    """Snap the box along y; returns (top, landed, bumped_ceiling).
+
+    `vy` is zeroed after the first snap exactly like the Python fallback,
+    so when the box straddles several solids the first overlapping row
+    wins and the later ones are ignored."""
+    h = b - t
+    t0 = t
+    b0 = b
+    landed = False
+    bumped = False
+    for i in range(aabb.shape[0]):
+        if (aabb[i, 2] > l and aabb[i, 0] < r
+                and aabb[i, 3] > t0 and aabb[i, 1] < b0):
+            if vy > 0:
+                t = aabb[i, 1] - h
+                vy = 0
+                landed = True
+            elif vy < 0:
+                t = aabb[i, 3]
+                vy = 0
+                bumped = True
+    return t, landed, bumped
+
+
+@njit(cache=True)
+def broad_phase(px, py, pr, pb, aabb, out):
+    """Write the indices of aabb rows overlapping the (px, py, pr, pb)
+    box into the preallocated int32 `out` buffer; returns the hit count."""
+    n = 0
+    for i in range(aabb.shape[0]):
+        if (aabb[i, 2] > px and aabb[i, 0] < pr
+                and aabb[i, 3] > py and aabb[i, 1] < pb):
+            out[n] = i
+            n += 1
+    return n
@@ -5,20 +5,39 @@ class Camera:
     def __init__(self):
         self.x = 0
         self.y = 0
-    
+        # reusable scratch rect so apply() does not allocate per call
+        self._scratch = pygame.Rect(0, 0, 0, 0)
+        self._off = (0, 0)
+
     def update(self, player_rect, level_width, level_height):
         # Simple follow camera, clamped to level bounds
         self.x = int(player_rect.centerx - BASE_WIDTH // 2)
         self.y = int(player_rect.centery - BASE_HEIGHT // 2)
-        
+
         # Clamp to level bounds
         self.x = max(0, min(level_width - BASE_WIDTH, self.x))
         self.y = max(0, min(level_height - BASE_HEIGHT, self.y))
-    
+
+        self._off = (-self.x, -self.y)
+
     def apply(self, rect):
-        """Convert world coordinates to screen coordinates"""
+        """Convert world coordinates to screen coordinates.
+
+        Returns a shared scratch rect, valid until the next apply() call;
+        use apply_copy() if the caller retains the result.
+        """
+        r = self._scratch
+        r.x = rect.x - self.x
+        r.y = rect.y - self.y
+        r.w = rect.width
+        r.h = rect.height
+        return r
+
+    def apply_copy(self, rect):
+        """Like apply(), but returns a fresh rect the caller may keep."""
         return pygame.Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
-    
+
     def apply_pos(self, x, y):
         """Convert world position to screen position"""
-        return (x - self.x, y - self.y)
\ No newline at end of file
+        off = self._off
+        return (x + off[0], y + off[1])
\ No newline at end of file
@@ -1,68 +1,190 @@
-import pygame
-
-def resolve_horizontal(player, platforms):
-    """Resolve horizontal collisions between player and platforms."""
-    player.rect.x = int(player.x)
-    for plat in platforms:
-        if player.rect.colliderect(plat):
-            if player.vx > 0:
-                player.rect.right = plat.left
-            elif player.vx < 0:
-                player.rect.left = plat.right
-            player.x = player.rect.x
-
-def resolve_vertical(player, platforms):
-    """Resolve vertical collisions between player and platforms."""
-    player.rect.y = int(player.y)
+import numpy as np
+
+# optional JIT-compiled kernels; numba is not a hard dependency
+try:
+    from _collision_numba import (broad_phase as _broad_phase_jit,
+                                  resolve_horizontal_kernel as _resolve_h_jit,
+                                  resolve_vertical_kernel as _resolve_v_jit)
+except ImportError:
+    _broad_phase_jit = None
+    _resolve_h_jit = None
+    _resolve_v_jit = None
+
+
+def warm_jit(aabb):
+    """Run each optional numba kernel once so the one-time compile cost
+    lands at level load instead of the first gameplay frame."""
+    if _broad_phase_jit is not None:
+        _broad_phase_jit(0, 0, 0, 0, aabb, np.empty(len(aabb), np.int32))
+    if _resolve_h_jit is not None:
+        _resolve_h_jit(0, 0, 1, 1, 0.0, aabb)
+    if _resolve_v_jit is not None:
+        _resolve_v_jit(0, 0, 1, 1, 0.0, aabb)
+
+# Cell size 64px (one tile); shifting by 6 maps a coordinate to its cell.
+CELL_SHIFT = 6
+
+class SpatialHashGrid:
+    """Uniform grid over static rects for broad-phase collision queries.
+
+    Each rect is inserted into every 64x64 cell its AABB overlaps; a query
+    returns only the rects sharing a cell with the queried rect, so the
+    narrow-phase colliderect tests run against a handful of candidates
+    instead of the whole level.
+    """
+    def __init__(self, rects=()):
+        self.cells = {}
+        for rect in rects:
+            self.insert(rect)
+
+    def _cell_range(self, rect):
+        return (rect.left >> CELL_SHIFT, (rect.right - 1) >> CELL_SHIFT,
+                rect.top >> CELL_SHIFT, (rect.bottom - 1) >> CELL_SHIFT)
+
+    def insert(self, rect):
+        cx0, cx1, cy0, cy1 = self._cell_range(rect)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                self.cells.setdefault((cx, cy), []).append(rect)
+
+    def remove(self, rect):
+        """Remove a previously inserted rect (matched by identity)."""
+        cx0, cx1, cy0, cy1 = self._cell_range(rect)
+        cells = self.cells
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for j, r in enumerate(bucket):
+                        if r is rect:
+                            del bucket[j]
+                            break
+
+    def query(self, rect):
+        """Return candidate rects overlapping the same cells as `rect`,
+        deduplicated, in insertion order."""
+        cx0, cx1, cy0, cy1 = self._cell_range(rect)
+        cells = self.cells
+        seen = {}
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for r in bucket:
+                        seen[id(r)] = r
+        return list(seen.values())
+
+def broad_phase_np(rect, aabb, out=None):
+    """Vectorized AABB overlap test against an (N, 4) int32 array of
+    (left, top, right, bottom) rows; returns the indices of rows
+    overlapping `rect`.
+
+    When numba is installed and a preallocated int32 `out` buffer is
+    supplied, the scan runs in a compiled kernel instead.
+    """
+    if _broad_phase_jit is not None and out is not None:
+        n = _broad_phase_jit(rect.left, rect.top, rect.right, rect.bottom,
+                             aabb, out)
+        return out[:n]
+    mask = ((aabb[:, 2] > rect.left) & (aabb[:, 0] < rect.right)
+            & (aabb[:, 3] > rect.top) & (aabb[:, 1] < rect.bottom))
+    return np.nonzero(mask)[0]
+
+def resolve_horizontal(player, platforms, aabb, out=None):
+    """Resolve horizontal collisions between player and platforms.
+
+    `platforms` is the flat rect list and `aabb` its SoA mirror built at
+    level load; the vectorized broad phase yields the few overlapping
+    indices to resolve.
+    """
+    # hoist hot attributes to locals (LOAD_FAST vs repeated LOAD_ATTR)
+    rect = player.rect
+    vx = player.vx
+    rect.x = int(player.x)
+    if _resolve_h_jit is not None:
+        left, hit = _resolve_h_jit(rect.left, rect.top, rect.right,
+                                   rect.bottom, float(vx), aabb)
+        if hit:
+            rect.left = int(left)
+            player.x = rect.x
+        return
+    for i in broad_phase_np(rect, aabb, out):
+        plat = platforms[i]
+        if vx > 0:
+            rect.right = plat.left
+        elif vx < 0:
+            rect.left = plat.right
+        player.x = rect.x
+
+def resolve_vertical(player, platforms, aabb, now, out=None):
+    """Resolve vertical collisions between player and platforms.
+
+    `now` is the frame timestamp, used for the coyote-time bookkeeping
+    instead of re-sampling the clock on landing."""
+    rect = player.rect
+    vy = player.vy
+    rect.y = int(player.y)
+    if _resolve_v_jit is not None:
+        top, landed, bumped = _resolve_v_jit(rect.left, rect.top, rect.right,
+                                             rect.bottom, float(vy), aabb)
+        if landed or bumped:
+            rect.top = int(top)
+            player.y = rect.y
+            player.vy = 0
+        if landed:
+            player.jumps_remaining = player.max_jumps
+            player.last_ground_time = now
+        player.on_ground = landed
+        return landed
     on_ground = False
-    for plat in platforms:
-        if player.rect.colliderect(plat):
-            if player.vy > 0:
-                # falling -> land on top
-                player.rect.bottom = plat.top
-                player.vy = 0
-                player.y = player.rect.y
-                on_ground = True
-                # refill jumps when landing
-                player.jumps_remaining = player.max_jumps
-                # Update coyote time tracking
-                player.on_ground = True
-                player.last_ground_time = pygame.time.get_ticks()
-            elif player.vy < 0:
-                # hit bottom of platform
-                player.rect.top = plat.bottom
-                player.vy = 0
-                player.y = player.rect.y
-    
-    # If not on ground after checking all platforms, update on_ground status
-    if not on_ground:
-        player.on_ground = False
-        
+    for i in broad_phase_np(rect, aabb, out):
+        plat = platforms[i]
+        if vy > 0:
+            # falling -> land on top
+            rect.bottom = plat.top
+            vy = 0
+            player.y = rect.y
+            on_ground = True
+            # refill jumps when landing
+            player.jumps_remaining = player.max_jumps
+            # Update coyote time tracking
+            player.last_ground_time = now
+        elif vy < 0:
+            # hit bottom of platform
+            rect.top = plat.bottom
+            vy = 0
+            player.y = rect.y
+
+    # single write-back of the mutated state
+    player.vy = vy
+    player.on_ground = on_ground
     return on_ground
 
-def clamp_player_to_level(player, level_width, level_height):
-    """Keep player within level bounds."""
-    # clamp player within horizontal level bounds
-    if player.rect.left < 0:
-        player.rect.left = 0
-        player.x = player.rect.x
-    if player.rect.right > level_width:
-        player.rect.right = level_width
-        player.x = player.rect.x
-
-    # clamp player vertically
-    if player.rect.top < 0:
-        player.rect.top = 0
-        player.y = player.rect.y
-    if player.rect.bottom > level_height:
-        player.rect.bottom = level_height
-        player.y = player.rect.y
+def clamp_player_to_level(player, level_width, level_height, now):
+    """Keep player within level bounds; `now` is the frame timestamp."""
+    rect = player.rect
+
+    # clamp both sides of each axis in one C-level min/max chain; only
+    # write player.x/y back when the clamp actually moved the rect, so
+    # the fractional float position survives unclamped frames
+    new_left = max(0, min(level_width - rect.width, rect.left))
+    if new_left != rect.left:
+        rect.left = new_left
+        player.x = rect.x
+
+    hit_bottom = rect.bottom >= level_height
+    new_top = max(0, min(level_height - rect.height, rect.top))
+    if new_top != rect.top:
+        rect.top = new_top
+        player.y = rect.y
+
+    if hit_bottom:
         player.vy = 0
         player.jumps_remaining = player.max_jumps
         # Update coyote time tracking when landing on level bottom
         player.on_ground = True
-        player.last_ground_time = pygame.time.get_ticks()
+        player.last_ground_time = now
 
     # keep player rect synchronized
-    player.rect.x = int(player.x)
-    player.rect.y = int(player.y)
\ No newline at end of file
+    rect.x = int(player.x)
+    rect.y = int(player.y)
\ No newline at end of file
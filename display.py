@@ -12,7 +12,8 @@ class DisplayManager:
         self.scale_y = 1.0
         self.offset_x = 0
         self.offset_y = 0
-        
+        self._scaled = None
+
         self.init_display()
     
     def init_display(self):
@@ -52,20 +53,39 @@ class DisplayManager:
         # Calculate offset to center the game area
         self.offset_x = (self.width - self.game_width) // 2
         self.offset_y = (self.height - self.game_height) // 2
-    
+
+        # precomputed coordinate-mapping state: pass-through when the
+        # window is at native base resolution, otherwise a 16.16
+        # fixed-point factor so scaling is an int multiply + shift
+        self._identity = (self.scale == 1.0
+                          and self.offset_x == 0 and self.offset_y == 0)
+        self._sxi = int(self.scale_x * 65536)
+        self._syi = int(self.scale_y * 65536)
+
+        # persistent destination buffer for the per-frame scale blit;
+        # recreated only when the window (and thus target size) changes
+        if self.scale != 1.0:
+            self._scaled = pygame.Surface((self.game_width, self.game_height)).convert()
+        else:
+            self._scaled = None
+
     def scale_pos(self, x, y):
         """Scale position from base resolution to actual screen resolution."""
-        scaled_x = int(x * self.scale_x) + self.offset_x
-        scaled_y = int(y * self.scale_y) + self.offset_y
-        return scaled_x, scaled_y
-    
+        if self._identity:
+            return x, y
+        return (((int(x) * self._sxi) >> 16) + self.offset_x,
+                ((int(y) * self._syi) >> 16) + self.offset_y)
+
     def scale_rect(self, rect):
         """Scale a rectangle from base resolution to actual screen resolution."""
-        x = int(rect.x * self.scale_x) + self.offset_x
-        y = int(rect.y * self.scale_y) + self.offset_y
-        w = int(rect.width * self.scale_x)
-        h = int(rect.height * self.scale_y)
-        return pygame.Rect(x, y, w, h)
+        if self._identity:
+            return pygame.Rect(rect)
+        sxi = self._sxi
+        syi = self._syi
+        return pygame.Rect(((rect.x * sxi) >> 16) + self.offset_x,
+                           ((rect.y * syi) >> 16) + self.offset_y,
+                           (rect.width * sxi) >> 16,
+                           (rect.height * syi) >> 16)
     
     def scale_surface(self, surface):
         """Scale a surface to match the display scale."""
@@ -77,16 +97,34 @@ class DisplayManager:
     
     def create_game_surface(self):
         """Create a surface for rendering the game at base resolution."""
-        return pygame.Surface((self.base_width, self.base_height))
+        # display format, so every per-frame blit onto it skips conversion
+        return pygame.Surface((self.base_width, self.base_height)).convert()
     
     def render_game_surface(self, game_surface):
         """Render the game surface to the screen with proper scaling."""
         if self.scale != 1.0:
-            scaled_surface = pygame.transform.scale(game_surface, (self.game_width, self.game_height))
-            self.screen.blit(scaled_surface, (self.offset_x, self.offset_y))
+            pygame.transform.scale(game_surface, (self.game_width, self.game_height), self._scaled)
+            self.screen.blit(self._scaled, (self.offset_x, self.offset_y))
         else:
             self.screen.blit(game_surface, (0, 0))
     
+    def update_rects(self, rects):
+        """Present only the given base-resolution rects.
+
+        Each rect is mapped through the window scaling (slightly inflated
+        to cover rounding seams) and handed to pygame.display.update, so
+        a mostly-static frame pushes a few small regions instead of the
+        whole window."""
+        if self._identity:
+            pygame.display.update(rects)
+            return
+        screen_rects = []
+        for r in rects:
+            sr = self.scale_rect(r)
+            sr.inflate_ip(4, 4)
+            screen_rects.append(sr)
+        pygame.display.update(screen_rects)
+
     def resize_window(self, new_width, new_height):
         """Handle window resize event."""
         self.width = new_width
@@ -7,12 +7,15 @@ class Enemy:
         self.patrol_min = patrol_min_x
         self.patrol_max = patrol_max_x
         self.speed = speed
+        self.surf = None  # pre-resolved texture, set at level load
 
     def update(self):
-        self.rect.x += self.vx
-        if self.rect.x < self.patrol_min:
-            self.rect.x = self.patrol_min
-            self.vx = abs(self.speed)
-        elif self.rect.x > self.patrol_max:
-            self.rect.x = self.patrol_max
-            self.vx = -abs(self.speed)
\ No newline at end of file
+        # single out-of-bounds branch in the common case, then one
+        # min/max clamp with the turn direction derived from which
+        # bound was hit
+        rect = self.rect
+        new_x = rect.x + self.vx
+        if new_x < self.patrol_min or new_x > self.patrol_max:
+            new_x = max(self.patrol_min, min(self.patrol_max, new_x))
+            self.vx = abs(self.speed) if new_x == self.patrol_min else -abs(self.speed)
+        rect.x = new_x
\ No newline at end of file
@@ -1,10 +1,90 @@
+import functools
 import pygame
 import random
+import threading
+import numpy as np
+from dataclasses import dataclass
 from constants import ASSETS_DIR, BASE_WIDTH, BASE_HEIGHT
 from enemy import Enemy
+from collision import SpatialHashGrid, broad_phase_np, warm_jit
 from settings import Settings
+from utils import get_texture
 from typing import List
 
+# Slotted entity records: no per-instance __dict__, fixed-offset
+# attribute access instead of per-frame dict-key lookups.
+@dataclass(slots=True, frozen=True)
+class Present:
+    rect: pygame.Rect
+    texture: str
+    surf: pygame.Surface
+
+@dataclass(slots=True, frozen=True)
+class PowerUp:
+    rect: pygame.Rect
+    type: str
+    surf: pygame.Surface
+
+def _prebuild(data):
+    """Build the static pygame.Rect objects for a level dict once.
+
+    Reloads (respawn, replay, game over) then reuse the prebuilt rects
+    instead of re-parsing the coordinate tuples. The rects are shared,
+    not copied: nothing in the game mutates level geometry, plus the
+    SoA arrays and numpy broad phase never write to them.
+    """
+    pre = data.get('_prebuilt')
+    if pre is None:
+        pre = {
+            'platforms': [pygame.Rect(*p) for p in data['platforms']],
+            'presents': [pygame.Rect(*p) for p in data['presents']],
+            'powerups': [(pygame.Rect(*p['rect']), p['type'])
+                         for p in data.get('powerups', [])],
+            'goal': pygame.Rect(*data['goal']),
+        }
+        data['_prebuilt'] = pre
+    return pre
+
+@functools.lru_cache(maxsize=1)
+def _ground_tile():
+    """The repeating ground tile, loaded and converted once."""
+    return pygame.image.load(str(ASSETS_DIR / "ground.png")).convert_alpha()
+
+# raw, unconverted surfaces decoded ahead of time by the preload thread;
+# _load_scaled_bg consumes them, keeping convert() on the main thread
+# where the display surface lives
+_bg_raw_cache = {}
+
+def _preload_bg_async(path_str):
+    """Decode a background PNG on a daemon thread while a level plays.
+
+    pygame.image.load is safe off the main thread as long as the surface
+    is only converted and blitted on it."""
+    def worker():
+        try:
+            _bg_raw_cache[path_str] = pygame.image.load(path_str)
+        except pygame.error:
+            pass
+    threading.Thread(target=worker, daemon=True).start()
+
+@functools.lru_cache(maxsize=8)
+def _load_scaled_bg(path_str, width, height):
+    """Load, convert and scale a background image.
+
+    Cached by (path, size) so level reloads and replays skip the PNG
+    decode and rescale entirely; a preloaded raw surface is used when
+    the background thread already decoded it.
+    """
+    img = _bg_raw_cache.pop(path_str, None)
+    if img is None:
+        img = pygame.image.load(path_str)
+    img = img.convert()
+    bg = pygame.transform.scale(img, (width, height))
+    # bake the flat dim layer in; the BLEND_MULT fill matches the old
+    # (0, 0, 0, 120) alpha overlay (255 - 120 = 135) with no per-frame cost
+    bg.fill((135, 135, 135), special_flags=pygame.BLEND_MULT)
+    return bg
+
 # --- Level definitions ---
 LEVELS = [
     {
@@ -86,16 +166,42 @@ class LevelManager:
         self.width = BASE_WIDTH
         self.height = BASE_HEIGHT
         self.ground = pygame.Rect(0, 0, self.width, 40)
+        self.ground_surface = None
         self.platforms = []
+        self.platform_surfs = []
+        self.collidables = []
+        self.plat_aabb = np.zeros((0, 4), np.int32)
+        self.bp_out = np.empty(0, np.int32)
+        # camera-view culling state (see update_visible)
+        self.cam_rect = pygame.Rect(0, 0, BASE_WIDTH, BASE_HEIGHT)
+        self.present_aabb = np.zeros((0, 4), np.int32)
+        self.powerup_aabb = np.zeros((0, 4), np.int32)
+        self.visible_platforms = []
+        self.visible_presents = []
+        self.visible_powerups = []
+        self.visible_enemies = []
         self.presents = []
+        self.present_rects = []
+        self.present_grid = SpatialHashGrid()
+        self._present_index = {}
         self.powerups = []
+        self.powerup_rects = []
+        self.powerup_grid = SpatialHashGrid()
+        self._powerup_index = {}
         self.enemies = []
+        self.enemy_rects = []
+        self.enemy_x = np.empty(0, np.float32)
+        self.enemy_vx = np.empty(0, np.float32)
+        self.enemy_min = np.empty(0, np.float32)
+        self.enemy_max = np.empty(0, np.float32)
+        self.enemy_speed = np.empty(0, np.float32)
         self.goal = pygame.Rect(0, 0, 0, 0)
+        self.tree_surf = None
+        self.tree_surf_done = None
         self.player_start = (0, 0)
         self.total_presents = 0
         self.name = ""
         self.background = None
-        self.overlay = None
 
         # load initial level
         self.load_level(self.index)
@@ -103,6 +209,7 @@ class LevelManager:
     def load_level(self, index: int):
         """Load level by index and initialize geometry, enemies, powerups, background, etc."""
         data = self.levels[index]
+        pre = _prebuild(data)
         self.index = index
         self.width = data.get('width', BASE_WIDTH)
         self.height = data.get('height', BASE_HEIGHT)
@@ -111,21 +218,67 @@ class LevelManager:
         ground_height = 40
         self.ground = pygame.Rect(0, self.height - ground_height, self.width, ground_height)
 
+        # bake the repeating tile into one level-wide strip so the draw
+        # loop pays a single blit instead of one per tile column
+        tile = _ground_tile()
+        self.ground_surface = pygame.Surface((self.width, tile.get_height()),
+                                             pygame.SRCALPHA).convert_alpha()
+        for x in range(0, self.width, tile.get_width()):
+            self.ground_surface.blit(tile, (x, 0))
+
         # floating platforms
-        self.platforms = [pygame.Rect(*p) for p in data['platforms']]
+        self.platforms = list(pre['platforms'])
 
-        # presents (with textures)
-        self.presents = []
-        for p in data['presents']:
-            rect = pygame.Rect(*p)
-            texture = random.choice(["present", "present1", "present2", "present3"])
-            self.presents.append({"rect": rect, "texture": texture})
+        # SoA mirror of all solid geometry (ground + platforms) as an
+        # (N, 4) int32 array of (left, top, right, bottom) rows for the
+        # vectorized broad phase; geometry is static per level
+        rects = [self.ground] + self.platforms
+        self.collidables = rects
+        xs = np.array([r.x for r in rects], np.int32)
+        ys = np.array([r.y for r in rects], np.int32)
+        ws = np.array([r.w for r in rects], np.int32)
+        hs = np.array([r.h for r in rects], np.int32)
+        self.plat_aabb = np.stack([xs, ys, xs + ws, ys + hs], axis=1)
+        # scratch index buffer for the (optional) numba broad-phase kernel
+        self.bp_out = np.empty(len(rects), np.int32)
+        broad_phase_np(self.ground, self.plat_aabb, self.bp_out)
+        # compile the optional numba kernels now rather than mid-frame
+        warm_jit(self.plat_aabb)
+
+        # presents (with textures); draw all random textures in one call
+        entries = pre['presents']
+        textures = random.choices(["present", "present1", "present2", "present3"],
+                                  k=len(entries))
+        self.presents = [Present(rect, tex, get_texture(tex, rect.size))
+                         for rect, tex in zip(entries, textures)]
 
         # powerups
-        self.powerups = [{'rect': pygame.Rect(*p['rect']), 'type': p['type']} for p in data.get('powerups', [])]
+        self.powerups = [PowerUp(rect, ptype, get_texture(ptype, rect.size))
+                         for rect, ptype in pre['powerups']]
+
+        # pre-resolve the remaining per-entity surfaces; sizes are fixed
+        # for the lifetime of the level, so the draw loop never has to
+        # call get_texture again
+        self.platform_surfs = [get_texture('platform', p.size) for p in self.platforms]
+
+        # parallel rect lists plus a spatial hash over them: the per-frame
+        # broad phase only narrow-tests pickups sharing a cell with the
+        # player. The id->index maps let grid hits feed the swap-pop
+        # removal without a linear search.
+        self.present_rects = [p.rect for p in self.presents]
+        self.powerup_rects = [p.rect for p in self.powerups]
+        self.present_grid = SpatialHashGrid(self.present_rects)
+        self.powerup_grid = SpatialHashGrid(self.powerup_rects)
+        self._present_index = {id(r): i for i, r in enumerate(self.present_rects)}
+        self._powerup_index = {id(r): i for i, r in enumerate(self.powerup_rects)}
 
         # enemies
         self.enemies = [Enemy(*e) for e in data.get('enemies', [])]
+        for e in self.enemies:
+            e.surf = get_texture('enemy', e.rect.size)
+        # the rects mutate in place as enemies patrol, so this list stays
+        # valid for a per-frame C-level collidelist sweep
+        self.enemy_rects = [e.rect for e in self.enemies]
 
         # apply difficulty scaling to enemy speed if settings available
         try:
@@ -138,25 +291,166 @@ class LevelManager:
                 # keep direction consistent with sign of vx
                 ent.vx = ent.speed if ent.vx >= 0 else -ent.speed
 
+        # SoA mirror of enemy patrol state for the vectorized batch step
+        self.enemy_x = np.array([e.rect.x for e in self.enemies], np.float32)
+        self.enemy_vx = np.array([e.vx for e in self.enemies], np.float32)
+        self.enemy_min = np.array([e.patrol_min for e in self.enemies], np.float32)
+        self.enemy_max = np.array([e.patrol_max for e in self.enemies], np.float32)
+        self.enemy_speed = np.array([e.speed for e in self.enemies], np.float32)
+
         # player start and goal
-        sx, sy = data['player_start']
-        gx, gy, gw, gh = data['goal']
-        self.goal = pygame.Rect(gx, gy, gw, gh)
-        self.player_start = (sx, sy)
+        self.goal = pre['goal']
+        self.tree_surf = get_texture('tree', self.goal.size)
+        self.tree_surf_done = get_texture('tree1', self.goal.size)
+        self.player_start = tuple(data['player_start'])
         self.total_presents = len(self.presents)
         self.name = data.get('name', f"Level {index+1}")
 
         # background load (bckg{index+1}.png)
         bg_path = ASSETS_DIR / f"bckg{index+1}.png"
         if bg_path.exists():
-            bg_img = pygame.image.load(str(bg_path)).convert()
-            self.background = pygame.transform.scale(bg_img, (self.width, self.height))
+            self.background = _load_scaled_bg(str(bg_path), self.width, self.height)
         else:
-            self.background = pygame.Surface((self.width, self.height))
-            self.background.fill((50, 50, 100))  # fallback color
+            self.background = pygame.Surface((self.width, self.height)).convert()
+            # fallback color, pre-dimmed like the loaded backgrounds
+            self.background.fill((26, 26, 52))
+
+        # visibility state starts as "everything visible" until the first
+        # update_visible() call of the frame loop
+        self._rebuild_collectible_aabbs()
+        self.visible_platforms = list(zip(self.platforms, self.platform_surfs))
+        self.visible_presents = list(self.presents)
+        self.visible_powerups = list(self.powerups)
+        self.visible_enemies = list(self.enemies)
+
+        # start decoding the next level's background while this one plays
+        if index + 1 < len(self.levels):
+            next_bg = ASSETS_DIR / f"bckg{index+2}.png"
+            if next_bg.exists() and str(next_bg) not in _bg_raw_cache:
+                _preload_bg_async(str(next_bg))
+
+    @staticmethod
+    def _rects_to_aabb(rects):
+        """Pack rects into an (N, 4) int32 (left, top, right, bottom) array."""
+        return np.array([(r.x, r.y, r.right, r.bottom) for r in rects],
+                        np.int32).reshape(-1, 4)
+
+    @staticmethod
+    def _swap_pop(items, rects, indices, index_map):
+        """Remove `indices` from the parallel item/rect lists by swapping
+        each with the last element and popping — O(1) per removal instead
+        of shifting the tail. Keeps `index_map` (id(rect) -> index)
+        consistent. Returns the removed items."""
+        popped = []
+        for i in sorted(indices, reverse=True):
+            popped.append(items[i])
+            del index_map[id(rects[i])]
+            items[i] = items[-1]
+            items.pop()
+            rects[i] = rects[-1]
+            rects.pop()
+            if i < len(rects):
+                index_map[id(rects[i])] = i
+        return popped
+
+    def _collect(self, player_rect, grid, index_map, items, rects):
+        candidates = grid.query(player_rect)
+        hits = [index_map[id(r)] for r in candidates
+                if player_rect.colliderect(r)]
+        if not hits:
+            return []
+        popped = self._swap_pop(items, rects, hits, index_map)
+        for p in popped:
+            grid.remove(p.rect)
+        return popped
+
+    def collect_presents(self, player_rect):
+        """Remove and return the presents touching `player_rect`.
+
+        The spatial grid narrows the exact tests to the pickups sharing a
+        cell with the player instead of sweeping the whole level list."""
+        return self._collect(player_rect, self.present_grid,
+                             self._present_index, self.presents,
+                             self.present_rects)
+
+    def collect_powerups(self, player_rect):
+        """Remove and return the powerups touching `player_rect`."""
+        return self._collect(player_rect, self.powerup_grid,
+                             self._powerup_index, self.powerups,
+                             self.powerup_rects)
+
+    def _rebuild_collectible_aabbs(self):
+        self.present_aabb = self._rects_to_aabb([p.rect for p in self.presents])
+        self.powerup_aabb = self._rects_to_aabb([p.rect for p in self.powerups])
+
+    def update_enemies(self):
+        """Advance every enemy patrol in a few vectorized ops.
+
+        Replaces the per-enemy Python update() call; positions are
+        written back to the rects the renderer and collision code use.
+        """
+        x = self.enemy_x
+        if not len(x):
+            return
+        vx = self.enemy_vx
+        x += vx
+        np.copyto(vx, self.enemy_speed, where=x < self.enemy_min)
+        np.copyto(vx, -self.enemy_speed, where=x > self.enemy_max)
+        np.clip(x, self.enemy_min, self.enemy_max, out=x)
+        # truncate each step like the scalar reference, which accumulates
+        # through the int rect — fractional speeds must not compound
+        np.trunc(x, out=x)
+        # one batched float->int conversion instead of per-element casts
+        for e, xi in zip(self.enemies, x.astype(np.int32).tolist()):
+            e.rect.x = xi
+
+    def iter_present_batches(self):
+        """Yield (surface, [rects]) batches of the visible presents.
+
+        Grouping by the pre-resolved surface lets the renderer push each
+        whole batch through one fblits call instead of a blit (and
+        texture lookup) per present.
+        """
+        by_surf = {}
+        for p in self.visible_presents:
+            by_surf.setdefault(p.surf, []).append(p.rect)
+        return by_surf.items()
+
+    def update_visible(self, camera):
+        """Recompute the entity subsets intersecting the camera view.
+
+        Most of a wide level is off-screen at any moment; the renderer
+        iterates only these lists. Static sets are masked against their
+        SoA arrays in one vectorized test; enemies move every frame, so
+        they go through collidelistall instead.
+        """
+        view = self.cam_rect
+        view.x = camera.x
+        view.y = camera.y
+
+        def _mask(aabb):
+            return np.nonzero(
+                (aabb[:, 2] > view.left) & (aabb[:, 0] < view.right)
+                & (aabb[:, 3] > view.top) & (aabb[:, 1] < view.bottom))[0]
+
+        # row 0 of plat_aabb is the ground, which is drawn separately
+        plats = self.platforms
+        surfs = self.platform_surfs
+        self.visible_platforms = [(plats[i], surfs[i])
+                                  for i in _mask(self.plat_aabb[1:])]
+
+        # collectibles shrink as they are picked up; re-pack when stale
+        if (self.present_aabb.shape[0] != len(self.presents)
+                or self.powerup_aabb.shape[0] != len(self.powerups)):
+            self._rebuild_collectible_aabbs()
+        presents = self.presents
+        self.visible_presents = [presents[i] for i in _mask(self.present_aabb)]
+        powerups = self.powerups
+        self.visible_powerups = [powerups[i] for i in _mask(self.powerup_aabb)]
 
-        self.overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.overlay.fill((0, 0, 0, 120))
+        enemies = self.enemies
+        hits = view.collidelistall([e.rect for e in enemies])
+        self.visible_enemies = [enemies[i] for i in hits]
 
     def next_level(self):
         """Advance to next level, return True if advanced, False if no more levels."""
@@ -10,7 +10,6 @@ from level import LevelManager, LEVELS
 from camera import Camera
 from collision import resolve_horizontal, resolve_vertical, clamp_player_to_level
 from ui import draw_hud, draw_message, show_message
-from utils import get_texture
 from settings import Settings
 from menu import MainMenu, PauseMenu, LevelSelect, OptionsMenu
 
@@ -25,15 +24,36 @@ big_font = pygame.font.SysFont(None, 48)
 
 game_surface = display.create_game_surface()
 
+# static text rendered once instead of on the frame it is shown
+victory_text = big_font.render("You saved Christmas! 🎅🎉", True, (255, 255, 200))
+
 # Settings
 settings = Settings.load()
 
+def build_scaled_durations():
+    """Powerup durations with the difficulty multiplier applied."""
+    return {k: int(v * settings.powerup_mult) for k, v in POWERUP_DURATIONS.items()}
+
+# rebuilt whenever the options menu may have changed the difficulty
+scaled_durations = build_scaled_durations()
+
+def refresh_key_bindings():
+    """Resolve the action keycodes once; the hot loop reads plain ints."""
+    global KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_PAUSE
+    KEY_LEFT = settings.get_key("left")
+    KEY_RIGHT = settings.get_key("right")
+    KEY_JUMP = settings.get_key("jump")
+    KEY_PAUSE = settings.get_key("pause")
+
+refresh_key_bindings()
+
 # --- Game State & Screens ---
 state = GameState.MAIN_MENU
 previous_state = GameState.MAIN_MENU  # Track where we came from for Options back button
+LEVEL_NAMES = tuple(lvl["name"] for lvl in LEVELS)
 main_menu = MainMenu(big_font, font)
 pause_menu = PauseMenu(big_font, font)
-level_select = LevelSelect(big_font, font, [lvl["name"] for lvl in LEVELS])
+level_select = LevelSelect(big_font, font, LEVEL_NAMES)
 options_menu = OptionsMenu(big_font, font, settings)
 
 # --- Game Objects (lazy init for levels) ---
@@ -58,26 +78,50 @@ lives = 0
 score = 0
 level_complete_time = None
 
-# mouse visible in menus
-pygame.mouse.set_visible(True)
+# mouse visible in menus; tracked so the per-frame calls below only hit
+# SDL when the visibility actually changes
+_cursor_visible = None
+
+def set_cursor(visible):
+    global _cursor_visible
+    if visible != _cursor_visible:
+        pygame.mouse.set_visible(visible)
+        _cursor_visible = visible
+
+set_cursor(True)
+
+# dirty-rect presentation state: with a static camera only the moving
+# actors and the HUD band change, so those regions alone are pushed to
+# the window; any camera motion (or menu frame) forces a full flip
+prev_cam_pos = None
+prev_dirty = []
+HUD_BAND = pygame.Rect(0, 0, BASE_WIDTH, 96)
 
 running = True
 while running:
     dt_ms = clock.tick(FPS)
     now = pygame.time.get_ticks()
-    events = list(pygame.event.get())
-
-    # Global window/system events
-    for ev in events:
-        if ev.type == pygame.QUIT:
-            running = False
-        elif ev.type == pygame.VIDEORESIZE:
-            display.resize_window(ev.w, ev.h)
-            game_surface = display.create_game_surface()
+    events = pygame.event.get()
 
     # --- STATE MACHINE ---
+    if state != GameState.PLAYING:
+        # Single sweep for window/system events and the pause toggle,
+        # recorded as flags the menu branches test; while playing these
+        # are folded into the gameplay event pass below
+        pause_pressed = False
+        for ev in events:
+            if ev.type == pygame.QUIT:
+                running = False
+            elif ev.type == pygame.VIDEORESIZE:
+                display.resize_window(ev.w, ev.h)
+                game_surface = display.create_game_surface()
+            elif ev.type == pygame.KEYDOWN and ev.key == KEY_PAUSE:
+                pause_pressed = True
+        # menu frames repaint everything; invalidate the play-state
+        # dirty tracking so re-entry starts with a full flip
+        prev_cam_pos = None
     if state == GameState.MAIN_MENU:
-        pygame.mouse.set_visible(True)
+        set_cursor(True)
         action = main_menu.render(game_surface, events, display.to_base_pos)
         # clear & draw
         display.render_game_surface(game_surface)
@@ -86,7 +130,7 @@ while running:
         if action == "Start":
             start_new_game(0)
             state = GameState.PLAYING
-            pygame.mouse.set_visible(False)
+            set_cursor(False)
         elif action == "Level Selector":
             state = GameState.LEVEL_SELECT
         elif action == "Options":
@@ -97,7 +141,7 @@ while running:
         continue
 
     if state == GameState.LEVEL_SELECT:
-        pygame.mouse.set_visible(True)
+        set_cursor(True)
         act = level_select.render(game_surface, events, display.to_base_pos)
         display.render_game_surface(game_surface)
         pygame.display.flip()
@@ -107,37 +151,38 @@ while running:
             idx = int(act.split("_")[-1])
             start_new_game(idx)
             state = GameState.PLAYING
-            pygame.mouse.set_visible(False)
+            set_cursor(False)
         continue
 
     if state == GameState.OPTIONS:
-        pygame.mouse.set_visible(True)
+        set_cursor(True)
         act = options_menu.render(game_surface, events, display.to_base_pos)
         display.render_game_surface(game_surface)
         pygame.display.flip()
         if act == "Back":
-            # Return to the previous menu
+            # Return to the previous menu; LevelSelect is stateless
+            # between visits, so it is never rebuilt here
             state = previous_state
-            # Rebuild LevelSelect if coming from there (names unchanged; but keep separation)
-            if previous_state == GameState.LEVEL_SELECT:
-                level_select = LevelSelect(big_font, font, [lvl["name"] for lvl in LEVELS])
-            # If we change difficulty, re-apply powerup multipliers at runtime
+            # If the difficulty or controls changed, re-apply them and
+            # write any pending changes out in one go
+            scaled_durations = build_scaled_durations()
+            refresh_key_bindings()
+            settings.flush()
             continue
         continue
 
     if state == GameState.PAUSED:
-        pygame.mouse.set_visible(True)
+        set_cursor(True)
         act = pause_menu.render(game_surface, events, display.to_base_pos)
         display.render_game_surface(game_surface)
         pygame.display.flip()
         # pause controls
-        for ev in events:
-            if ev.type == pygame.KEYDOWN and ev.key == settings.get_key("pause"):
-                state = GameState.PLAYING
-                pygame.mouse.set_visible(False)
+        if pause_pressed:
+            state = GameState.PLAYING
+            set_cursor(False)
         if act == "Resume":
             state = GameState.PLAYING
-            pygame.mouse.set_visible(False)
+            set_cursor(False)
         elif act == "Options":
             previous_state = GameState.PAUSED
             state = GameState.OPTIONS
@@ -146,35 +191,35 @@ while running:
         continue
 
     # --- PLAYING ---
-    pygame.mouse.set_visible(False)
+    set_cursor(False)
 
     # Input mapping
     keys = pygame.key.get_pressed()
 
-    # Handle pause
+    # One pass over the queue: window/system events and gameplay keys
     for ev in events:
-        if ev.type == pygame.KEYDOWN and ev.key == settings.get_key("pause"):
-            state = GameState.PAUSED
-
-        elif ev.type == pygame.KEYDOWN and ev.key == settings.get_key("jump"):
-            if player and player.can_jump(now):
+        if ev.type == pygame.KEYDOWN:
+            if ev.key == KEY_PAUSE:
+                state = GameState.PAUSED
+            elif ev.key == KEY_JUMP and player.can_jump(now):
                 player.vy = player.jump_strength
                 player.jumps_remaining -= 1
+        elif ev.type == pygame.QUIT:
+            running = False
+        elif ev.type == pygame.VIDEORESIZE:
+            display.resize_window(ev.w, ev.h)
+            game_surface = display.create_game_surface()
+            prev_cam_pos = None
 
     # Movement
     player.vx = 0
-    if keys[settings.get_key("left")]:
+    if keys[KEY_LEFT]:
         player.vx = -player.speed
         player.facing_right = False
-    if keys[settings.get_key("right")]:
+    if keys[KEY_RIGHT]:
         player.vx = player.speed
         player.facing_right = True
 
-    # Powerups durations apply multiplier by difficulty
-    def scaled_duration(ptype: str) -> int:
-        base = POWERUP_DURATIONS[ptype]
-        return int(base * settings.powerup_mult)
-    
     # Update powerup states
     player.update_powerups(now)
 
@@ -184,106 +229,103 @@ while running:
         player.vy = MAX_FALL
 
     player.x += player.vx
-    resolve_horizontal(player, [level_manager.ground] + level_manager.platforms)
+    resolve_horizontal(player, level_manager.collidables, level_manager.plat_aabb, level_manager.bp_out)
     player.y += player.vy
-    on_ground = resolve_vertical(player, [level_manager.ground] + level_manager.platforms)
-    clamp_player_to_level(player, level_manager.width, level_manager.height)
+    on_ground = resolve_vertical(player, level_manager.collidables, level_manager.plat_aabb, now, level_manager.bp_out)
+    clamp_player_to_level(player, level_manager.width, level_manager.height, now)
 
     # Camera & enemies
     camera.update(player.rect, level_manager.width, level_manager.height)
-    for e in level_manager.enemies:
-        e.update()
+    level_manager.update_enemies()
+
+    # world rects vacated this frame; must be repainted even when the
+    # camera is static
+    removed_rects = []
 
     # Presents
-    for p in level_manager.presents[:]:
-        if player.rect.colliderect(p["rect"]):
-            level_manager.presents.remove(p)
+    collected = level_manager.collect_presents(player.rect)
+    if collected:
+        for p in collected:
+            removed_rects.append(p.rect)
             score += 1
-            show_message("Present collected!", 900)
+        show_message("Present collected!", 900, now)
 
     # Powerups
-    for pu in level_manager.powerups[:]:
-        if player.rect.colliderect(pu['rect']):
-            ptype = pu['type']
-            player.apply_powerup(ptype, scaled_duration(ptype), now)
-            level_manager.powerups.remove(pu)
-            show_message(f"Powerup: {ptype}", 1100)
-
-    # Enemies collide
-    collided_enemy = None
-    for e in level_manager.enemies:
-        if player.rect.colliderect(e.rect):
-            collided_enemy = e
-            break
-
-    if collided_enemy:
+    for pu in level_manager.collect_powerups(player.rect):
+        removed_rects.append(pu.rect)
+        player.apply_powerup(pu.type, scaled_durations[pu.type], now)
+        show_message(f"Powerup: {pu.type}", 1100, now)
+
+    # visibility after collection, so a pickup removed this frame never
+    # lingers in the visible lists for one extra draw
+    level_manager.update_visible(camera)
+
+    # Enemies collide: one C-level sweep over the cached rect list
+    if player.rect.collidelist(level_manager.enemy_rects) != -1:
         if not player.is_invincible(now):
             lives -= 1
             if lives <= 0:
-                show_message("Game Over! Returning to Menu...", 1800)
+                show_message("Game Over! Returning to Menu...", 1800, now)
                 pygame.time.delay(1200)
                 state = GameState.MAIN_MENU
                 continue
             else:
-                player.respawn(*level_manager.player_start)
-                show_message("You lost a life!", 900)
+                player.respawn(*level_manager.player_start, now)
+                show_message("You lost a life!", 900, now)
 
     # Goal
     if player.rect.colliderect(level_manager.goal):
         if score >= level_manager.total_presents:
             if not level_manager.completed:
                 level_manager.completed = True
-                level_complete_time = pygame.time.get_ticks()
-                show_message("Level Complete!", 1500)
+                level_complete_time = now
+                removed_rects.append(level_manager.goal)  # tree swaps texture
+                show_message("Level Complete!", 1500, now)
         else:
-            show_message("Collect all presents before the tree!", 1300)
+            show_message("Collect all presents before the tree!", 1300, now)
 
     # Drawing
     if level_manager.background:
-        game_surface.blit(level_manager.background, (-camera.x, -camera.y))
+        # copy only the camera window of the level-sized background
+        game_surface.blit(level_manager.background, (0, 0),
+                          area=level_manager.cam_rect)
     else:
         game_surface.fill((24, 36, 60))
 
-    game_surface.blit(level_manager.overlay, (-camera.x, -camera.y))
-
-    tile = pygame.image.load("assets/ground.png").convert_alpha()
-    tile_width = tile.get_width()
-
-    for x in range(0, level_manager.ground.width, tile_width):
-        game_surface.blit(tile, (level_manager.ground.x + x - camera.x,
-                        level_manager.ground.y - camera.y))
-
-    for plat in level_manager.platforms:
-        surf = get_texture('platform', (plat.width, plat.height))
-        game_surface.blit(surf, (plat.x - camera.x, plat.y - camera.y))
-
-    for p in level_manager.presents:
-        surf = get_texture(p["texture"], (p["rect"].width, p["rect"].height))
-        game_surface.blit(surf, (p["rect"].x - camera.x, p["rect"].y - camera.y))
-
-    for pu in level_manager.powerups:
-        surf = get_texture(pu['type'], (pu['rect'].width, pu['rect'].height))
-        game_surface.blit(surf, (pu['rect'].x - camera.x, pu['rect'].y - camera.y))
-
-    for e in level_manager.enemies:
-        surf = get_texture('enemy', (e.rect.width, e.rect.height))
-        game_surface.blit(surf, (e.rect.x - camera.x, e.rect.y - camera.y))
-
-    tree_texture_name = 'tree1' if level_manager.completed else 'tree'
-    surf_tree = get_texture(tree_texture_name, (level_manager.goal.width, level_manager.goal.height))
-    game_surface.blit(surf_tree, (level_manager.goal.x - camera.x, level_manager.goal.y - camera.y))
+    game_surface.blit(level_manager.ground_surface,
+                      (level_manager.ground.x - camera.x,
+                       level_manager.ground.y - camera.y))
+
+    # world sprites: collect every visible (surf, screen_pos) pair and
+    # push them through one batched call, keeping the old draw order
+    # platforms -> presents -> powerups -> enemies -> tree
+    cx = camera.x
+    cy = camera.y
+    blit_seq = [(surf, (plat.x - cx, plat.y - cy))
+                for plat, surf in level_manager.visible_platforms]
+    for surf, rects in level_manager.iter_present_batches():
+        blit_seq += [(surf, (r.x - cx, r.y - cy)) for r in rects]
+    for pu in level_manager.visible_powerups:
+        blit_seq.append((pu.surf, (pu.rect.x - cx, pu.rect.y - cy)))
+    for e in level_manager.visible_enemies:
+        blit_seq.append((e.surf, (e.rect.x - cx, e.rect.y - cy)))
+    if level_manager.cam_rect.colliderect(level_manager.goal):
+        surf_tree = level_manager.tree_surf_done if level_manager.completed else level_manager.tree_surf
+        blit_seq.append((surf_tree, (level_manager.goal.x - cx, level_manager.goal.y - cy)))
+    game_surface.fblits(blit_seq)
 
     player.update_animation(dt_ms)
     surf_player = player.get_current_frame()
-    if not (player.is_invincible(now) and (now // 150) % 2 == 0):
+    # flicker gate: bit test instead of divide+modulo (~128 ms phase)
+    if not (player.is_invincible(now) and not (now & 128)):
         game_surface.blit(surf_player, (player.rect.x - camera.x, player.rect.y - camera.y))
 
-    draw_hud(game_surface, font, lives, score, level_manager, player)
-    draw_message(game_surface, font)
+    draw_hud(game_surface, font, lives, score, level_manager, player, now)
+    draw_message(game_surface, font, now)
 
     # Delayed level switch
     if level_manager.completed and level_complete_time is not None:
-        if pygame.time.get_ticks() - level_complete_time > LEVEL_COMPLETE_DELAY:
+        if now - level_complete_time > LEVEL_COMPLETE_DELAY:
             advanced = level_manager.next_level()
             if advanced:
                 # re-apply difficulty enemy scaling on new level already handled in load_level
@@ -291,17 +333,34 @@ while running:
                 score = 0
                 level_manager.completed = False
                 level_complete_time = None
+                prev_cam_pos = None  # new level: full repaint
             else:
                 game_surface.fill((10,10,40))
-                text = big_font.render("You saved Christmas! 🎅🎉", True, (255,255,200))
-                game_surface.blit(text, (BASE_WIDTH//2 - text.get_width()//2, BASE_HEIGHT//2 - text.get_height()//2))
+                game_surface.blit(victory_text, (BASE_WIDTH//2 - victory_text.get_width()//2, BASE_HEIGHT//2 - victory_text.get_height()//2))
                 display.render_game_surface(game_surface)
                 pygame.display.flip()
                 pygame.time.delay(2000)
                 state = GameState.MAIN_MENU
 
     display.render_game_surface(game_surface)
-    pygame.display.flip()
 
+    # presentation: flip when the whole view shifted, otherwise push only
+    # the regions that changed (previous + current actor positions, any
+    # vacated pickups, and the HUD band)
+    cam_pos = (camera.x, camera.y)
+    dirty = [player.rect.move(-cam_pos[0], -cam_pos[1]).inflate(8, 8)]
+    for e in level_manager.visible_enemies:
+        dirty.append(e.rect.move(-cam_pos[0], -cam_pos[1]).inflate(8, 8))
+    for r in removed_rects:
+        dirty.append(r.move(-cam_pos[0], -cam_pos[1]).inflate(8, 8))
+    dirty.append(HUD_BAND)
+    if cam_pos == prev_cam_pos:
+        display.update_rects(prev_dirty + dirty)
+    else:
+        pygame.display.flip()
+    prev_cam_pos = cam_pos
+    prev_dirty = dirty
+
+settings.flush()
 pygame.quit()
 sys.exit()
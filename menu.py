@@ -1,5 +1,6 @@
 # menu.py
 import pygame
+from bisect import bisect_right
 from typing import List, Optional, Callable, Tuple
 from constants import BASE_WIDTH, BASE_HEIGHT
 from settings import Settings, DIFFICULTY_PRESETS, key_const_to_name
@@ -12,10 +13,26 @@ ACCENT= (180,220,255)
 class Button:
     def __init__(self, rect: pygame.Rect, text: str, font: pygame.font.Font):
         self.rect = rect
-        self.text = text
         self.font = font
         self.hover = False
         self.disabled = False
+        self._text = text
+        self._labels = None  # (normal, disabled) surfaces, rendered lazily
+        # rects never move after layout; cache the edges for the per-frame
+        # hover test as plain int compares
+        self._x1, self._y1 = rect.left, rect.top
+        self._x2, self._y2 = rect.right, rect.bottom
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        # invalidate the cached label surfaces on change (e.g. rebind flow)
+        if value != self._text:
+            self._text = value
+            self._labels = None
 
     def draw(self, surf: pygame.Surface):
         color = (60,70,95) if not self.hover else (75, 90, 120)
@@ -23,11 +40,15 @@ class Button:
         pygame.draw.rect(surf, color, self.rect, border_radius=8)
         pygame.draw.rect(surf, (20,25,40), self.rect, 2, border_radius=8)
 
-        t = self.font.render(self.text, True, WHITE if not self.disabled else (140,140,140))
+        if self._labels is None:
+            self._labels = (self.font.render(self._text, True, WHITE),
+                            self.font.render(self._text, True, (140,140,140)))
+        t = self._labels[1] if self.disabled else self._labels[0]
         surf.blit(t, (self.rect.centerx - t.get_width()//2, self.rect.centery - t.get_height()//2))
 
     def update_hover(self, mouse_pos: Tuple[int,int]):
-        self.hover = self.rect.collidepoint(mouse_pos)
+        x, y = mouse_pos
+        self.hover = (self._x1 <= x < self._x2 and self._y1 <= y < self._y2)
 
     def clicked(self, ev: pygame.event.Event) -> bool:
         return (ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1 and self.rect.collidepoint(ev.pos) and not self.disabled)
@@ -38,9 +59,11 @@ class MenuBase:
         self.big_font = big_font
         self.font = font
         self.buttons: List[Button] = []
+        # title never changes; render it once
+        self._title_surf = big_font.render(title, True, WHITE)
 
     def draw_title(self, surf):
-        t = self.big_font.render(self.title, True, WHITE)
+        t = self._title_surf
         surf.blit(t, (BASE_WIDTH//2 - t.get_width()//2, 70))
 
     def layout_buttons(self, labels: List[str], start_y=170, gap=60, width=360, height=48):
@@ -51,16 +74,17 @@ class MenuBase:
             self.buttons.append(Button(rect, label, self.font))
 
     def draw_and_handle(self, surf, events, to_base_pos) -> Optional[str]:
-        mx, my = to_base_pos(*pygame.mouse.get_pos())   # <- base coords
+        # one base-space position per frame / per click, shared by every test
+        pos = to_base_pos(*pygame.mouse.get_pos())      # <- base coords
         for b in self.buttons:
-            b.update_hover((mx, my))
+            b.update_hover(pos)
             b.draw(surf)
 
         for ev in events:
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                ex, ey = to_base_pos(*ev.pos)           # <- base coords
+                click = to_base_pos(*ev.pos)            # <- base coords
                 for b in self.buttons:
-                    if b.rect.collidepoint((ex, ey)) and not b.disabled:
+                    if b.rect.collidepoint(click) and not b.disabled:
                         return b.text
         return None
 
@@ -78,11 +102,12 @@ class PauseMenu(MenuBase):
     def __init__(self, big_font, font):
         super().__init__("Paused", big_font, font)
         self.layout_buttons(["Resume", "Options", "Quit to Menu"])
+        # the dim backdrop is constant; allocate and fill it once
+        self._overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill((0,0,0,160))
 
     def render(self, surf, events, to_base_pos):
-        overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0,0,0,160))
-        surf.blit(overlay, (0,0))
+        surf.blit(self._overlay, (0,0))
         self.draw_title(surf)
         return self.draw_and_handle(surf, events, to_base_pos)
 
@@ -99,23 +124,24 @@ class LevelSelect(MenuBase):
             rect = pygame.Rect(x, start_y + i*gap, width, height)
             self.buttons.append(Button(rect, f"Start: {i+1} – {name}", font))
         self.back_btn = Button(pygame.Rect(x, start_y + len(level_names)*gap + 20, width, height), "Back", font)
+        self._all_buttons = self.buttons + [self.back_btn]
 
     def render(self, surf, events, to_base_pos):
         surf.fill(DARK)
         self.draw_title(surf)
 
-        mx, my = to_base_pos(*pygame.mouse.get_pos())
-        for b in self.buttons + [self.back_btn]:
-            b.update_hover((mx, my))
+        pos = to_base_pos(*pygame.mouse.get_pos())
+        for b in self._all_buttons:
+            b.update_hover(pos)
             b.draw(surf)
 
         for ev in events:
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                ex, ey = to_base_pos(*ev.pos)
+                click = to_base_pos(*ev.pos)
                 for idx, b in enumerate(self.buttons):
-                    if b.rect.collidepoint((ex, ey)):
+                    if b.rect.collidepoint(click):
                         return f"START_LEVEL_{idx}"
-                if self.back_btn.rect.collidepoint((ex, ey)):
+                if self.back_btn.rect.collidepoint(click):
                     return "Back"
         return None
 
@@ -153,6 +179,19 @@ class OptionsMenu(MenuBase):
             current_label = self.settings.controls.get(action, action.upper())
             self.control_buttons.append((action, Button(rect, current_label, font)))
 
+        # every interactable button, gathered once for hover/draw sweeps
+        self._all_buttons = ([self.diff_left, self.diff_right, self.back_btn]
+                             + [btn for _, btn in self.control_buttons])
+
+        # hover lookup: buttons bucketed per row, rows sorted by top edge
+        # so a bisect on the mouse y lands on the only candidate band
+        rows = {}
+        for b in self._all_buttons:
+            rows.setdefault(b.rect.y, []).append(b)
+        self._row_tops = sorted(rows)
+        self._rows = [rows[y] for y in self._row_tops]
+        self._hovered: Optional[Button] = None
+
     def render(
         self,
         surf: pygame.Surface,
@@ -176,13 +215,23 @@ class OptionsMenu(MenuBase):
         surf.blit(value, (BASE_WIDTH//2 - value.get_width()//2, 178))
 
         # --- Draw controls & buttons using base-space mouse coords for hover ---
-        mx_screen, my_screen = pygame.mouse.get_pos()
-        mx, my = to_base_pos(mx_screen, my_screen)
-
-        # gather every interactable button for hover/draw
-        all_buttons = [self.diff_left, self.diff_right, self.back_btn] + [btn for _, btn in self.control_buttons]
-        for b in all_buttons:
-            b.update_hover((mx, my))
+        # bisect to the row under the cursor and narrow-test only its
+        # buttons; flip hover flags just on the button that changed
+        pos = to_base_pos(*pygame.mouse.get_pos())
+        hovered = None
+        i = bisect_right(self._row_tops, pos[1]) - 1
+        if i >= 0:
+            for b in self._rows[i]:
+                if b.rect.collidepoint(pos):
+                    hovered = b
+                    break
+        if hovered is not self._hovered:
+            if self._hovered is not None:
+                self._hovered.hover = False
+            if hovered is not None:
+                hovered.hover = True
+            self._hovered = hovered
+        for b in self._all_buttons:
             b.draw(surf)
 
         # control labels (left side)
@@ -214,17 +263,17 @@ class OptionsMenu(MenuBase):
 
             # Mouse clicks: convert click pos to base-space before testing rects
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                ex, ey = to_base_pos(*ev.pos)
+                click = to_base_pos(*ev.pos)
 
                 # Difficulty left/right
-                if self.diff_left.rect.collidepoint((ex, ey)):
+                if self.diff_left.rect.collidepoint(click):
                     self.diff_index = (self.diff_index - 1) % len(self.diff_labels)
                     self.settings.difficulty = self.diff_labels[self.diff_index]
                     self.settings.apply_difficulty()
                     self.settings.save()
                     continue
 
-                if self.diff_right.rect.collidepoint((ex, ey)):
+                if self.diff_right.rect.collidepoint(click):
                     self.diff_index = (self.diff_index + 1) % len(self.diff_labels)
                     self.settings.difficulty = self.diff_labels[self.diff_index]
                     self.settings.apply_difficulty()
@@ -232,12 +281,12 @@ class OptionsMenu(MenuBase):
                     continue
 
                 # Back button
-                if self.back_btn.rect.collidepoint((ex, ey)):
+                if self.back_btn.rect.collidepoint(click):
                     return "Back"
 
                 # Control rebind buttons
                 for action, btn in self.control_buttons:
-                    if btn.rect.collidepoint((ex, ey)):
+                    if btn.rect.collidepoint(click):
                         # Enter rebind mode for this action
                         self.awaiting_rebind = action
                         # Visual feedback: change text to "..." while waiting
@@ -24,6 +24,9 @@ class Player:
         # powerups timers
         self.power_until = {'speed_boost':0,'double_jump':0,'invincibility':0}
         self.hit_invincible_until = 0
+        # single deadline covering both invincibility sources, refreshed
+        # wherever either of them is set
+        self.invincible_until = 0
 
         # --- Animation ---
         self.idle_frame = get_texture("player", (self.w, self.h))
@@ -31,33 +34,36 @@ class Player:
             get_texture("player1", (self.w, self.h)),
             get_texture("player2", (self.w, self.h))
         ]
+        # left-facing variants flipped once here, indexed by facing_right
+        # (False=0 left, True=1 right) so drawing never calls transform.flip
+        self.idle_frames = (pygame.transform.flip(self.idle_frame, True, False),
+                            self.idle_frame)
+        self.walk_frames_by_dir = (
+            [pygame.transform.flip(f, True, False) for f in self.walk_frames],
+            self.walk_frames,
+        )
         self.current_frame = 0
         self.animation_timer = 0
         self.animation_speed = ANIMATION_SPEED
 
     def update_animation(self, dt_ms):
         if self.vx != 0:  # moving
-            self.animation_timer += dt_ms
-            if self.animation_timer >= self.animation_speed:
-                self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.walk_frames)
+            # wrap the timer over the whole cycle and derive the frame
+            # index from it: branch-free and robust to large dt spikes
+            cycle = len(self.walk_frames) * self.animation_speed
+            self.animation_timer = (self.animation_timer + dt_ms) % cycle
+            self.current_frame = self.animation_timer // self.animation_speed
         else:
             self.current_frame = 0  # reset walk animation when idle
+            self.animation_timer = 0
 
     def get_current_frame(self):
         if self.vx != 0:  # moving
-            frame = self.walk_frames[self.current_frame]
-        else:  # idle
-            frame = self.idle_frame
-
-        # Flip horizontally if facing left
-        if not self.facing_right:
-            frame = pygame.transform.flip(frame, True, False)
-
-        return frame
+            return self.walk_frames_by_dir[self.facing_right][self.current_frame]
+        return self.idle_frames[self.facing_right]
 
     def is_invincible(self, now_ms):
-        return now_ms < self.power_until['invincibility'] or now_ms < self.hit_invincible_until
+        return now_ms < self.invincible_until
 
     def update_powerups(self, now_ms):
         # speed boost duration effect
@@ -77,18 +83,23 @@ class Player:
 
     def apply_powerup(self, ptype, duration_ms, now_ms):
         self.power_until[ptype] = now_ms + duration_ms
+        if ptype == 'invincibility':
+            self.invincible_until = max(self.power_until['invincibility'],
+                                        self.hit_invincible_until)
         # if double jump power gained immediately refill jumps so player can use it right away
         if ptype == 'double_jump':
             self.jumps_remaining = self.max_jumps if now_ms < self.power_until['double_jump'] else self.jumps_remaining
 
-    def respawn(self, start_x, start_y):
+    def respawn(self, start_x, start_y, now_ms):
         self.x = float(start_x)
         self.y = float(start_y)
         self.rect.topleft = (start_x, start_y)
         self.vx = 0
         self.vy = 0
         # give a short invincible window after respawn
-        self.hit_invincible_until = pygame.time.get_ticks() + RESPAWN_INVINCIBLE_TIME
+        self.hit_invincible_until = now_ms + RESPAWN_INVINCIBLE_TIME
+        self.invincible_until = max(self.power_until['invincibility'],
+                                    self.hit_invincible_until)
         # Reset coyote time on respawn
         self.last_ground_time = 0
         self.on_ground = False
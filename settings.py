@@ -1,6 +1,7 @@
 # settings.py
 from __future__ import annotations
 import json
+import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -19,21 +20,34 @@ DEFAULT_CONTROLS = {
     "pause": "ESCAPE",
 }
 
+# memoized name<->keycode translations; the same few bindings are looked
+# up repeatedly and the pygame resolution is comparatively pricey
+_name_to_const = {}
+_const_to_name = {}
+
 def key_name_to_const(name: str) -> int:
     import pygame
     name = name.upper()
-    # Allow both pygame names and symbols
-    if hasattr(pygame, f"K_{name.lower()}"):
-        return getattr(pygame, f"K_{name.lower()}")
-    try:
-        return pygame.key.key_code(name.lower())
-    except Exception:
-        return pygame.K_UNKNOWN
+    code = _name_to_const.get(name)
+    if code is None:
+        # Allow both pygame names and symbols
+        if hasattr(pygame, f"K_{name.lower()}"):
+            code = getattr(pygame, f"K_{name.lower()}")
+        else:
+            try:
+                code = pygame.key.key_code(name.lower())
+            except Exception:
+                code = pygame.K_UNKNOWN
+        _name_to_const[name] = code
+    return code
 
 def key_const_to_name(code: int) -> str:
     import pygame
-    n = pygame.key.name(code)
-    return n.upper()
+    name = _const_to_name.get(code)
+    if name is None:
+        name = pygame.key.name(code).upper()
+        _const_to_name[code] = name
+    return name
 
 @dataclass
 class Settings:
@@ -49,6 +63,7 @@ class Settings:
         if self.controls is None:
             self.controls = DEFAULT_CONTROLS.copy()
         self.apply_difficulty()
+        self._dirty = False
 
     @classmethod
     def load(cls) -> "Settings":
@@ -62,13 +77,25 @@ class Settings:
                 pass
         s = cls()
         s.save()
+        s.flush()
         return s
 
     def save(self):
-        SETTINGS_PATH.write_text(json.dumps({
+        """Mark the settings dirty; the disk write is deferred to flush()
+        so rapid menu clicks don't each pay a synchronous file write."""
+        self._dirty = True
+
+    def flush(self):
+        """Write pending changes to disk atomically; no-op when clean."""
+        if not self._dirty:
+            return
+        tmp = SETTINGS_PATH.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({
             "difficulty": self.difficulty,
             "controls": self.controls
         }, indent=2), encoding="utf-8")
+        os.replace(tmp, SETTINGS_PATH)
+        self._dirty = False
 
     def apply_difficulty(self):
         p = DIFFICULTY_PRESETS.get(self.difficulty, DIFFICULTY_PRESETS["Normal"])
@@ -1,44 +1,73 @@
-import pygame
-from constants import BASE_WIDTH, MESSAGE_DURATION
+from constants import BASE_WIDTH
 
 # Message display variables
 message = ""
 message_until = 0
 
-def show_message(text, ms=MESSAGE_DURATION):
-    """Display a message for a specified duration."""
+# rendered-text cache: HUD strings repeat unchanged for many frames, so
+# font.render runs only when a string first appears
+_text_cache = {}
+
+def render_cached(font, text, color):
+    """font.render with memoization keyed by (font, text, color).
+
+    The cache is cleared wholesale once it collects 256 entries, which
+    the handful of live HUD strings never approach."""
+    key = (id(font), text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) >= 256:
+            _text_cache.clear()
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+    return surf
+
+def show_message(text, ms, now):
+    """Display a message for `ms` from the frame timestamp `now`."""
     global message, message_until
     message = text
-    message_until = pygame.time.get_ticks() + ms
+    message_until = now + ms
 
-def draw_hud(screen, font, lives, score, level_manager, player):
-    """Draw the heads-up display with game information."""
+# last rendered powerup countdown per type: (seconds, surface)
+_timer_memo = {}
+
+def draw_hud(screen, font, lives, score, level_manager, player, now):
+    """Draw the heads-up display; `now` is the frame timestamp."""
     # Lives, Level, Score
-    lives_surf = font.render(f"Lives: {lives}", True, (255,255,255))
-    level_surf = font.render(f"Level: {level_manager.index+1} - {level_manager.name}", True, (255,255,255))
-    score_surf = font.render(f"Presents: {score}/{level_manager.total_presents}", True, (255,255,255))
-    screen.blit(lives_surf, (10, 8))
-    screen.blit(level_surf, (10, 32))
-    screen.blit(score_surf, (10, 56))
+    lives_surf = render_cached(font, f"Lives: {lives}", (255,255,255))
+    level_surf = render_cached(font, f"Level: {level_manager.index+1} - {level_manager.name}", (255,255,255))
+    score_surf = render_cached(font, f"Presents: {score}/{level_manager.total_presents}", (255,255,255))
+    screen.fblits(((lives_surf, (10, 8)),
+                   (level_surf, (10, 32)),
+                   (score_surf, (10, 56))))
 
     # active powerups + timers
-    now = pygame.time.get_ticks()
     x = BASE_WIDTH - 10
     y = 8
     for ptype in ['double_jump','speed_boost','invincibility']:
         end = player.power_until[ptype]
         if end > now:
             remain_s = (end - now) // 1000 + 1
-            text = f"{ptype} {remain_s}s"
-            surf = font.render(text, True, (255,255,255))
+            # the countdown only changes once a second; skip even the
+            # string build and cache lookup on the frames in between
+            memo = _timer_memo.get(ptype)
+            if memo is None or memo[0] != remain_s:
+                surf = render_cached(font, f"{ptype} {remain_s}s", (255,255,255))
+                _timer_memo[ptype] = (remain_s, surf)
+            else:
+                surf = memo[1]
             rect = surf.get_rect(topright=(x,y))
             screen.blit(surf, rect)
             y += 22
 
-def draw_message(screen, font):
-    """Draw the current message if active."""
-    global message, message_until
-    now = pygame.time.get_ticks()
-    if message and now < message_until:
-        m_surf = font.render(message, True, (255, 255, 255))
-        screen.blit(m_surf, (BASE_WIDTH//2 - m_surf.get_width()//2, 8))
\ No newline at end of file
+def draw_message(screen, font, now):
+    """Draw the current message if active; `now` is the frame timestamp."""
+    global message
+    if not message:
+        return
+    if now >= message_until:
+        # drop the expired text so later frames take the one-compare path
+        message = ""
+        return
+    m_surf = render_cached(font, message, (255, 255, 255))
+    screen.blit(m_surf, (BASE_WIDTH//2 - m_surf.get_width()//2, 8))
\ No newline at end of file
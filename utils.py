@@ -1,8 +1,43 @@
+import atexit
+import pickle
 import pygame
+from pathlib import Path
 from constants import ASSETS_DIR
 
 # --- Texture Cache ---
+# _texture_cache holds the final scaled surfaces by (name, size);
+# _src_cache holds each decoded source image once, so requesting the
+# same asset at several sizes decodes the PNG a single time.
 _texture_cache = {}
+_src_cache = {}
+
+# --- Disk cache for scaled textures ---
+# The smoothscale of each (name, size) pair is deterministic, so the raw
+# RGBA bytes are persisted across runs; entries carry the source mtime
+# and are dropped when the asset changes. All disk I/O is best-effort.
+_DISK_CACHE_PATH = Path.home() / ".cache" / "santa-platformer" / "textures.bin"
+_disk_dirty = False
+
+def _load_disk_cache():
+    try:
+        with open(_DISK_CACHE_PATH, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
+
+_disk_cache = _load_disk_cache()
+
+def _flush_disk_cache():
+    if not _disk_dirty:
+        return
+    try:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_DISK_CACHE_PATH, "wb") as f:
+            pickle.dump(_disk_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass
+
+atexit.register(_flush_disk_cache)
 
 def get_texture(name, size):
     """
@@ -19,15 +54,34 @@ def get_texture(name, size):
     if key in _texture_cache:
         return _texture_cache[key]
 
+    global _disk_dirty
     path = ASSETS_DIR / f"{name}.png"
     w, h = size
     surf = None
     if path.exists():
-        try:
-            img = pygame.image.load(str(path)).convert_alpha()
-            surf = pygame.transform.smoothscale(img, (w, h))
-        except Exception as e:
-            print("Failed to load", path, e)
+        mtime = path.stat().st_mtime
+        cached = _disk_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            try:
+                surf = pygame.image.frombuffer(cached[1], size, "RGBA").convert_alpha()
+            except Exception:
+                surf = None
+        if surf is None:
+            try:
+                img = _src_cache.get(name)
+                if img is None:
+                    img = pygame.image.load(str(path)).convert_alpha()
+                    _src_cache[name] = img
+                if img.get_size() == (w, h):
+                    # already the requested size; nothing to rescale (or
+                    # to persist, since the source loads just as fast)
+                    surf = img
+                else:
+                    surf = pygame.transform.smoothscale(img, (w, h))
+                    _disk_cache[key] = (mtime, pygame.image.tobytes(surf, "RGBA"))
+                    _disk_dirty = True
+            except Exception as e:
+                print("Failed to load", path, e)
 
     if surf is None:
         surf = pygame.Surface((w, h), pygame.SRCALPHA)